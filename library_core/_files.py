@@ -0,0 +1,57 @@
+"""File helpers shared by the agents and dispatchers that cache file contents."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+BUFFER_SIZE = 65536
+
+
+class FileStamp(NamedTuple):
+    """Identity of a file's current contents, as far as ``stat`` can tell."""
+
+    ino: int
+    size: int
+    mtime_ns: int
+    # ctime cannot be set from user space, so restoring the mtime with
+    # ``os.utime`` after an edit still changes the stamp.
+    ctime_ns: int
+
+
+def stat_stamp(path: "os.PathLike[str] | str") -> Optional[FileStamp]:
+    """Return the file's stamp, or ``None`` when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return FileStamp(stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+@contextmanager
+def atomic_writer(path: Path) -> Iterator[BinaryIO]:
+    """
+    Yield a buffered binary handle whose contents replace ``path`` on success.
+
+    Each call writes to its own temporary file in the target directory, so
+    overlapping writers never rename each other's file away; the last
+    ``os.replace`` wins. On error the temporary file is removed and ``path``
+    is left untouched.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=BUFFER_SIZE) as handle:
+            yield handle
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:  # pragma: no cover - defensive
+            pass
+        raise
+
+
+__all__ = ["BUFFER_SIZE", "FileStamp", "atomic_writer", "stat_stamp"]
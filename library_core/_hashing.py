@@ -0,0 +1,26 @@
+"""SHA-256 helpers shared by the hash-chained ledger agents."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, List
+
+# ``hashlib`` delegates to OpenSSL's libcrypto, which already selects the
+# SHA-NI / AVX2 compression routines at runtime from the CPU feature flags.
+# Binding the constructor once keeps the attribute lookup off the hot path
+# and gives a single place to swap in another backend.
+_sha256 = hashlib.sha256
+
+
+def sha256_hex(data: bytes) -> str:
+    """Return the hex digest of ``data``."""
+    return _sha256(data).hexdigest()
+
+
+def sha256_hex_many(buffers: Iterable[bytes]) -> List[str]:
+    """Return the hex digest of each buffer in order (one ``hashlib`` call per buffer)."""
+    sha256 = _sha256
+    return [sha256(buf).hexdigest() for buf in buffers]
+
+
+__all__ = ["sha256_hex", "sha256_hex_many"]
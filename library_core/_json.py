@@ -0,0 +1,92 @@
+"""
+JSON helpers that prefer ``orjson`` when it is installed.
+
+These are for storage and transport only. Anything that is hashed (the
+ledger's canonical form) uses a single standard-library encoding so digests
+never depend on which package is installed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _has_non_finite(obj: Any) -> bool:
+    # Iterative walk with a scalar fast path; this runs on every encode whose
+    # output contains null, so it has to stay cheaper than ``json.dumps``.
+    stack = [obj]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        if value is None or isinstance(value, (str, int)):
+            continue
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            extend(value)
+    return False
+
+
+def _encode(obj: Any, indent: Optional[int]) -> bytes:
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:  # orjson.JSONEncodeError: >64-bit ints, lone surrogates, ...
+            pass
+        else:
+            # orjson silently writes NaN/Infinity as null. ``None`` values are
+            # common, so only walk the value when null appears at all, and only
+            # re-encode when a non-finite float is really there.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+    separators = None if indent else (",", ":")
+    text = json.dumps(obj, indent=indent, separators=separators, ensure_ascii=False)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form; keep them as \u escapes instead.
+        return json.dumps(obj, indent=indent, separators=separators).encode("ascii")
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """
+    Compact UTF-8 encoding that keeps the object's own key order.
+
+    Anything orjson cannot represent exactly falls back to ``json.dumps``, so
+    every value the standard library accepts round-trips unchanged.
+    """
+    return _encode(obj, None)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Two-space indented UTF-8 encoding for state files, with the same fallback."""
+    return _encode(obj, 2)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode JSON; raises ``json.JSONDecodeError`` on invalid input.
+
+    orjson rejects ``NaN``/``Infinity`` and escaped lone surrogates, which the
+    fallback encoders above can write, so those inputs are retried with the
+    standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+__all__ = ["dumps_compact", "dumps_indented", "loads"]
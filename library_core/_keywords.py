@@ -0,0 +1,44 @@
+"""Single-pass keyword matching for the stage, persona, and mantra tables."""
+
+from __future__ import annotations
+
+import re
+from typing import FrozenSet, Iterable, Mapping, Optional, Set
+
+
+class KeywordMatcher:
+    """
+    Report which labels have at least one keyword occurring in a text.
+
+    All keywords are compiled into one zero-width lookahead alternation,
+    longest first, so a single ``finditer`` sweep finds the longest keyword
+    starting at every position. Shorter keywords hidden inside a longer
+    match (``"begin"`` inside ``"begin again"``) are recovered through a
+    precomputed substring closure, which keeps the results identical to
+    testing ``keyword in text`` for every keyword.
+    """
+
+    def __init__(self, keywords: Mapping[str, Iterable[str]]) -> None:
+        pairs = [(keyword, label) for label, words in keywords.items() for keyword in words]
+        words = sorted({keyword for keyword, _ in pairs}, key=len, reverse=True)
+        self._order = tuple(keywords)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, words)) + "))")
+        self._closure: dict[str, FrozenSet[str]] = {
+            word: frozenset(label for keyword, label in pairs if keyword in word) for word in words
+        }
+
+    def labels(self, text: str) -> Set[str]:
+        """Return every label with a keyword present in ``text``."""
+        found: Set[str] = set()
+        closure = self._closure
+        for match in self._pattern.finditer(text):
+            found |= closure[match.group(1)]
+        return found
+
+    def first(self, text: str) -> Optional[str]:
+        """Return the first label, in mapping order, with a keyword in ``text``."""
+        found = self.labels(text)
+        return next((label for label in self._order if label in found), None)
+
+
+__all__ = ["KeywordMatcher"]
@@ -1,14 +1,29 @@
 """
 Public re-export surface for agent implementations.
+
+Agent classes are resolved lazily (PEP 562) so importing one agent does not
+pull in the modules of the others.
 """
 
 from __future__ import annotations
 
-from .echo_agent import EchoAgent
-from .garden_agent import GardenAgent
-from .kira_agent import KiraAgent
-from .limnus_agent import LimnusAgent
-from .vessel_index_agent import VesselIndexAgent
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .echo_agent import EchoAgent
+    from .garden_agent import GardenAgent
+    from .kira_agent import KiraAgent
+    from .limnus_agent import LimnusAgent
+    from .vessel_index_agent import VesselIndexAgent
+
+_EXPORTS = {
+    "GardenAgent": ".garden_agent",
+    "EchoAgent": ".echo_agent",
+    "LimnusAgent": ".limnus_agent",
+    "KiraAgent": ".kira_agent",
+    "VesselIndexAgent": ".vessel_index_agent",
+}
 
 __all__ = [
     "GardenAgent",
@@ -17,3 +32,16 @@ __all__ = [
     "KiraAgent",
     "VesselIndexAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__ entirely
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
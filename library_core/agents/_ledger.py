@@ -0,0 +1,106 @@
+"""Append-only JSONL storage for the Limnus hash-chained ledger."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from library_core._files import BUFFER_SIZE, atomic_writer
+from library_core._hashing import sha256_hex
+from library_core._json import dumps_compact, loads
+
+LEDGER_FILE = Path("state") / "ledger.jsonl"
+LEGACY_LEDGER_FILE = Path("state") / "ledger.json"
+
+_TAIL_WINDOW = 4096
+
+# Fixed-width UTC timestamp; unlike ``isoformat`` it always carries microseconds.
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def iso_now() -> str:
+    return datetime.now(timezone.utc).strftime(_ISO_FORMAT)
+
+
+def canonical_bytes(block: Dict[str, Any]) -> bytes:
+    """
+    Serialise ``block`` (minus its ``hash``) into the form that gets hashed.
+
+    This is the ledger's original ``json.dumps(sort_keys=True)`` encoding and
+    the only canonical form: it is produced by one encoder regardless of what
+    is installed, accepts every value the standard library does, and keeps
+    non-ASCII text (including lone surrogates) as ``\\u`` escapes.
+    """
+    # A C-level shallow copy plus pop beats a per-key comprehension and still
+    # covers every field, so unexpected extra keys stay under the hash.
+    payload = dict(block)
+    payload.pop("hash", None)
+    return json.dumps(payload, sort_keys=True).encode("ascii")
+
+
+def block_hash(block: Dict[str, Any]) -> str:
+    return sha256_hex(canonical_bytes(block))
+
+
+def iter_blocks(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ledger blocks one line at a time.
+
+    A workspace that has not been migrated yet (no Limnus agent has started
+    since the JSONL switch) still has only the legacy ``ledger.json`` array;
+    its blocks are read from there instead.
+    """
+    try:
+        handle = path.open("rb", buffering=BUFFER_SIZE)
+    except FileNotFoundError:
+        legacy_path = path.with_name(LEGACY_LEDGER_FILE.name)
+        if not legacy_path.exists():
+            raise
+        yield from loads(legacy_path.read_bytes())
+        return
+    with handle:
+        for line in handle:
+            if line.strip():
+                yield loads(line)
+
+
+def read_last_block(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the final block by scanning backwards from the end of the file."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+    window = _TAIL_WINDOW
+    with path.open("rb") as handle:
+        while True:
+            start = max(0, size - window)
+            handle.seek(start)
+            lines = handle.read(size - start).rstrip().split(b"\n")
+            # The first line may be truncated unless the window reached byte 0.
+            if len(lines) > 1 or start == 0:
+                tail = lines[-1].strip()
+                return loads(tail) if tail else None
+            window *= 2
+
+
+def append_block(path: Path, block: Dict[str, Any]) -> None:
+    with path.open("ab") as handle:
+        handle.write(dumps_compact(block) + b"\n")
+
+
+def migrate_legacy(workspace_path: Path) -> None:
+    """Convert a pre-JSONL ``ledger.json`` array into ``ledger.jsonl``."""
+    legacy_path = workspace_path / LEGACY_LEDGER_FILE
+    ledger_path = workspace_path / LEDGER_FILE
+    if ledger_path.exists() or not legacy_path.exists():
+        return
+    try:
+        blocks = loads(legacy_path.read_bytes())
+    except json.JSONDecodeError:
+        return
+    with atomic_writer(ledger_path) as handle:
+        for block in blocks:
+            handle.write(dumps_compact(block) + b"\n")
@@ -0,0 +1,89 @@
+"""Process-wide cache of each ledger's head hash, used by Limnus when appending."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+from library_core._files import FileStamp, stat_stamp
+from library_core.agents._ledger import append_block, block_hash, iso_now, read_last_block
+
+
+@dataclass(slots=True)
+class _Entry:
+    stamp: FileStamp
+    head_hash: str
+
+
+class LedgerCache:
+    """
+    Keeps each ledger's head hash in memory.
+
+    Entries are keyed by path and validated against the file's stat stamp
+    (see :func:`library_core._files.stat_stamp`), so writes made outside this
+    cache (another process, a manual edit) are picked up on the next access.
+    Appends made through :meth:`append` and :meth:`append_next` update the
+    cached entry in place instead of invalidating it. Callers run in worker
+    threads, hence a thread lock; :meth:`append_next` holds it across the
+    head read and the write.
+
+    Only the chain head is cached. Verification (``KiraAgent``) always
+    re-reads the ledger file.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def head_hash(self, path: Path) -> str:
+        """Return the hash of the final block, reading only the file tail on a miss."""
+        with self._lock:
+            return self._head_locked(path)
+
+    def _head_locked(self, path: Path) -> str:
+        key = str(path)
+        stamp = stat_stamp(path)
+        if stamp is None:
+            self._entries.pop(key, None)
+            return ""
+        entry = self._entries.get(key)
+        if entry is None or entry.stamp != stamp:
+            last = read_last_block(path)
+            head = last.get("hash", "") if last else ""
+            entry = self._entries[key] = _Entry(stamp, head)
+        return entry.head_hash
+
+    def append(self, path: Path, block: Dict[str, Any]) -> None:
+        """Append ``block`` to the ledger file and record it as the new head."""
+        with self._lock:
+            self._append_locked(path, block)
+
+    def append_next(self, path: Path, block: Dict[str, Any]) -> None:
+        """
+        Chain ``block`` onto the current head and append it.
+
+        ``ts``, ``prev`` and ``hash`` are filled in while the lock is held, so
+        concurrent callers are serialised into one linear, time-ordered chain
+        instead of forking from the same head.
+        """
+        with self._lock:
+            block["ts"] = iso_now()
+            block["prev"] = self._head_locked(path)
+            block["hash"] = block_hash(block)
+            self._append_locked(path, block)
+
+    def _append_locked(self, path: Path, block: Dict[str, Any]) -> None:
+        key = str(path)
+        append_block(path, block)
+        after = stat_stamp(path)
+        if after is None:  # pragma: no cover - removed underneath us
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = _Entry(after, block["hash"])
+
+
+LEDGER_CACHE = LedgerCache()
+
+__all__ = ["LEDGER_CACHE", "LedgerCache"]
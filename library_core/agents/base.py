@@ -5,11 +5,17 @@ from __future__ import annotations
 import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 from library_core.storage import StorageManager
 from workspace.manager import WorkspaceManager
 
+BlockingCall = Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+
+
+def _run_calls(calls: Sequence[BlockingCall]) -> Tuple[Any, ...]:
+    return tuple(func(*args, **kwargs) for func, args, kwargs in calls)
+
 
 @dataclass(slots=True)
 class AgentConfig:
@@ -48,3 +54,7 @@ class BaseAgent(ABC):
 
     async def _run_blocking(self, func, *args, **kwargs):  # type: ignore[no-untyped-def]
         return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _run_blocking_batch(self, calls: Sequence[BlockingCall]) -> Tuple[Any, ...]:
+        """Run ``(func, args, kwargs)`` calls in order within a single worker-thread hop."""
+        return await asyncio.to_thread(_run_calls, calls)
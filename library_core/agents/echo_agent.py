@@ -2,11 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import re
+from itertools import product
+from typing import Any, Dict, Tuple
 
 from library_core.agents.base import BaseAgent
 
 
+def _mode_weights(is_long: bool, has_paradox: bool, is_short: bool) -> Tuple[float, float, float, str]:
+    """Return rounded (alpha, beta, gamma) weights and the dominant persona."""
+    alpha = 0.3
+    beta = 0.3
+    gamma = 0.4
+
+    if is_long:
+        beta += 0.2
+    if has_paradox:
+        gamma += 0.2
+    if is_short:
+        alpha += 0.1
+
+    total = alpha + beta + gamma or 1.0
+    alpha, beta, gamma = alpha / total, beta / total, gamma / total
+
+    persona = "paradox"
+    if alpha >= beta and alpha >= gamma:
+        persona = "squirrel"
+    elif beta > alpha and beta >= gamma:
+        persona = "fox"
+    return round(alpha, 3), round(beta, 3), round(gamma, 3), persona
+
+
+# The weights depend only on three flags, so every outcome is computed once here.
+_MODE_TABLE = {flags: _mode_weights(*flags) for flags in product((False, True), repeat=3)}
+
+
 class EchoAgent(BaseAgent):
     """Stylises the input and updates persona mode weights."""
 
@@ -16,32 +46,26 @@ class EchoAgent(BaseAgent):
         "fox": ("debug", "analyze", "plan", "solve"),
         "paradox": ("why", "mystery", "spiral", "quantum", "?"),
     }
+    # One case-insensitive alternation pass: no per-keyword scan, no lowered copy.
+    # ASCII folding only: Unicode folding would also match "ſ" or "İ", which lower() did not.
+    PARADOX_PATTERN = re.compile(
+        "|".join(map(re.escape, PERSONA_KEYWORDS["paradox"])), re.IGNORECASE | re.ASCII
+    )
 
     async def process(self, context) -> Dict[str, Any]:  # noqa: ANN001
         user_text = context.input_text or ""
         styled = f"“{user_text}” ~ echoed by a whisper"
 
-        alpha = 0.3
-        beta = 0.3
-        gamma = 0.4
-        lower = user_text.lower()
-
-        if len(user_text) > 120:
-            beta += 0.2
-        if any(keyword in lower for keyword in self.PERSONA_KEYWORDS["paradox"]):
-            gamma += 0.2
-        if len(user_text) < 40:
-            alpha += 0.1
-
-        total = alpha + beta + gamma or 1.0
-        alpha, beta, gamma = alpha / total, beta / total, gamma / total
-        state = {"alpha": round(alpha, 3), "beta": round(beta, 3), "gamma": round(gamma, 3)}
-
-        persona = "paradox"
-        if alpha >= beta and alpha >= gamma:
-            persona = "squirrel"
-        elif beta > alpha and beta >= gamma:
-            persona = "fox"
+        text_len = len(user_text)
+        alpha, beta, gamma, persona = _MODE_TABLE[
+            (
+                text_len > 120,
+                self.PARADOX_PATTERN.search(user_text) is not None,
+                text_len < 40,
+            )
+        ]
+        state = {"alpha": alpha, "beta": beta, "gamma": gamma}
+
         emoji = self.PERSONA_EMOJI.get(persona, "∿")
         styled = f"{styled} {emoji}"
 
@@ -9,6 +9,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from library_core._keywords import KeywordMatcher
 from library_core.agents.base import AgentConfig, BaseAgent
 from library_core.storage import StorageManager
 from workspace.manager import WorkspaceManager
@@ -41,6 +42,8 @@ class GardenAgent(BaseAgent):
         "give": ["give", "share", "offer"],
         "begin_again": ["begin again", "restart", "new cycle"],
     }
+    STAGE_MATCHER = KeywordMatcher(STAGE_KEYWORDS)
+    CONSENT_MATCHER = KeywordMatcher({phrase: (phrase,) for phrase in CONSENT_PHRASES})
 
     def __init__(
         self,
@@ -138,34 +141,33 @@ class GardenAgent(BaseAgent):
                 current_stage = new_stage
                 stage_changed = True
         else:
-            for stage, keywords in self.STAGE_KEYWORDS.items():
-                if any(keyword in text_lower for keyword in keywords):
-                    if stage != current_stage:
-                        event_kind = "stage_transition"
-                        event_data = {"from": current_stage, "to": stage, "text": user_text}
-                        current_stage = stage
-                        stage_changed = True
-                        break
-
-        for phrase in self.CONSENT_PHRASES:
-            if phrase in text_lower:
-                event_kind = "consent"
-                consent_given = True
-                consent_record = {
-                    "id": str(uuid.uuid4()),
-                    "ts": self._current_ts(),
-                    "phrase": phrase,
-                    "user_id": context.user_id,
-                    "text": user_text,
-                }
-                consents.append(consent_record)
-                event_data = {
-                    "text": user_text,
-                    "phrase": phrase,
-                    "consent_id": consent_record["id"],
-                }
-                logger.info("Consent recorded: %s", phrase)
-                break
+            matched_stages = self.STAGE_MATCHER.labels(text_lower)
+            for stage in self.STAGE_KEYWORDS:
+                if stage in matched_stages and stage != current_stage:
+                    event_kind = "stage_transition"
+                    event_data = {"from": current_stage, "to": stage, "text": user_text}
+                    current_stage = stage
+                    stage_changed = True
+                    break
+
+        phrase = self.CONSENT_MATCHER.first(text_lower)
+        if phrase is not None:
+            event_kind = "consent"
+            consent_given = True
+            consent_record = {
+                "id": str(uuid.uuid4()),
+                "ts": self._current_ts(),
+                "phrase": phrase,
+                "user_id": context.user_id,
+                "text": user_text,
+            }
+            consents.append(consent_record)
+            event_data = {
+                "text": user_text,
+                "phrase": phrase,
+                "consent_id": consent_record["id"],
+            }
+            logger.info("Consent recorded: %s", phrase)
 
         prev_hash = entries[-1]["hash"] if entries else ""
         new_entry = {
@@ -189,11 +191,18 @@ class GardenAgent(BaseAgent):
             }
         )
         state["ledger"] = ledger
-        await self.save_state("garden", state)
-
-        await self.append_log(
-            "garden",
-            {"entry_id": new_entry["id"], "kind": event_kind, "stage": current_stage},
+        await self._run_blocking_batch(
+            [
+                (self.record.save_state, ("garden", state), {}),
+                (
+                    self.record.append_log,
+                    (
+                        "garden",
+                        {"entry_id": new_entry["id"], "kind": event_kind, "stage": current_stage},
+                    ),
+                    {},
+                ),
+            ]
         )
 
         result = {
@@ -2,57 +2,73 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
+from library_core._hashing import sha256_hex
+from library_core.agents._ledger import LEDGER_FILE, canonical_bytes, iter_blocks
 from library_core.agents.base import BaseAgent
 
 
-class KiraAgent(BaseAgent):
-    """Validates ledger integrity and ritual compliance."""
+def _ts_before(current: str, previous: str) -> bool:
+    # Equal-width UTC "Z" timestamps order lexicographically; only mixed widths
+    # (e.g. legacy entries without microseconds) need a real parse.
+    if len(current) == len(previous):
+        return current < previous
+    return datetime.fromisoformat(current.replace("Z", "+00:00")) < datetime.fromisoformat(
+        previous.replace("Z", "+00:00")
+    )
 
-    async def process(self, context) -> Dict[str, Any]:  # noqa: ANN001
-        issues: List[str] = []
-        ledger_path = self.record.path / "state" / "ledger.json"
 
-        try:
-            ledger_blocks: List[Dict[str, Any]] = json.loads(ledger_path.read_text(encoding="utf-8"))
-        except Exception as exc:  # pragma: no cover - defensive
-            issues.append(f"Ledger read error: {exc}")
-            ledger_blocks = []
+def _verify_ledger(ledger_path: Path) -> List[str]:
+    """
+    Verify the hash chain; runs in a worker thread, off the event loop.
+
+    Blocks are streamed one line at a time and each is hashed and checked
+    against the previous block as it is read, so memory stays constant in
+    the ledger length. The file is re-read on every call rather than served
+    from a cache: an integrity check must see the bytes on disk, not an
+    earlier parse of them.
+    """
+    issues: List[str] = []
+    prev_block: Optional[Dict[str, Any]] = None
+    try:
+        for index, block in enumerate(iter_blocks(ledger_path)):
+            if block.get("hash") != sha256_hex(canonical_bytes(block)):
+                issues.append(f"Hash mismatch at block {index}")
 
-        if not ledger_blocks:
-            issues.append("Ledger missing or empty")
-        else:
-            first_block = ledger_blocks[0]
-            if first_block.get("prev"):
-                issues.append("Genesis block prev field should be empty")
+            if prev_block is None:
+                if block.get("prev"):
+                    issues.append("Genesis block prev field should be empty")
+            else:
+                if block.get("prev") != prev_block.get("hash"):
+                    issues.append(f"Broken prev link at block {index}")
+                try:
+                    if _ts_before(block["ts"], prev_block["ts"]):
+                        issues.append(f"Timestamp out of order at block {index}")
+                except Exception:  # pragma: no cover - defensive
+                    pass
+            prev_block = block
+    except Exception as exc:  # pragma: no cover - defensive
+        issues.append(f"Ledger read error: {exc}")
 
-            for index, block in enumerate(ledger_blocks):
-                block_copy = {k: block[k] for k in block if k != "hash"}
-                calc_hash = hashlib.sha256(
-                    json.dumps(block_copy, sort_keys=True).encode("utf-8")
-                ).hexdigest()
-                if block.get("hash") != calc_hash:
-                    issues.append(f"Hash mismatch at block {index}")
+    if prev_block is None:
+        issues.append("Ledger missing or empty")
+    return issues
 
-                if index > 0:
-                    expected_prev = ledger_blocks[index - 1].get("hash")
-                    if block.get("prev") != expected_prev:
-                        issues.append(f"Broken prev link at block {index}")
-                    try:
-                        prev_ts = datetime.fromisoformat(
-                            ledger_blocks[index - 1]["ts"].replace("Z", "+00:00")
-                        )
-                        curr_ts = datetime.fromisoformat(block["ts"].replace("Z", "+00:00"))
-                        if curr_ts < prev_ts:
-                            issues.append(f"Timestamp out of order at block {index}")
-                    except Exception:  # pragma: no cover - defensive
-                        pass
 
-        garden_state = await self.get_state("garden")
+class KiraAgent(BaseAgent):
+    """Validates ledger integrity and ritual compliance."""
+
+    async def process(self, context) -> Dict[str, Any]:  # noqa: ANN001
+        issues: List[str]
+        issues, garden_state = await self._run_blocking_batch(
+            [
+                (_verify_ledger, (self.record.path / LEDGER_FILE,), {}),
+                (self.record.load_state, ("garden", {}), {}),
+            ]
+        )
         ledger = garden_state.get("ledger", {})
         entries = ledger.get("entries", [])
         if not any(entry.get("kind") == "consent" for entry in entries):
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
-import hashlib
 import json
-import uuid
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from library_core._files import BUFFER_SIZE, FileStamp, atomic_writer, stat_stamp
+from library_core._json import dumps_indented, loads
+from library_core.agents._ledger import LEDGER_FILE, block_hash, iso_now, migrate_legacy
+from library_core.agents._ledger_cache import LEDGER_CACHE
 from library_core.agents.base import BaseAgent
 
 if TYPE_CHECKING:
@@ -17,9 +18,11 @@ if TYPE_CHECKING:
     from library_core.storage import StorageManager
     from workspace.manager import WorkspaceManager
 
-
-def _iso_now() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+_L1, _L2, _L3 = 1, 2, 3
+_LAYER_CODES = {"L1": _L1, "L2": _L2, "L3": _L3}  # unknown layers map to 0 and are left alone
+_LAYER_NAMES = {code: name for name, code in _LAYER_CODES.items()}
+_PROMOTE_L1 = bytes.maketrans(bytes([_L1]), bytes([_L2]))
+_PROMOTE_L2 = bytes.maketrans(bytes([_L2]), bytes([_L3]))
 
 
 class LimnusAgent(BaseAgent):
@@ -33,85 +36,104 @@ class LimnusAgent(BaseAgent):
     ) -> None:
         super().__init__(workspace_id, storage, manager)
         self.mem_path = self.record.path / "state" / "limnus_memory.json"
-        self.ledger_path = self.record.path / "state" / "ledger.json"
+        self.ledger_path = self.record.path / LEDGER_FILE
         self.mem_path.parent.mkdir(parents=True, exist_ok=True)
 
         if not self.mem_path.exists():
             self.mem_path.write_text("[]", encoding="utf-8")
+        migrate_legacy(self.record.path)
         if not self.ledger_path.exists():
             genesis = {
-                "ts": _iso_now(),
+                "ts": iso_now(),
                 "kind": "genesis",
                 "data": {"anchor": "I return as breath."},
                 "prev": "",
             }
-            genesis["hash"] = hashlib.sha256(
-                json.dumps(genesis, sort_keys=True).encode("utf-8")
-            ).hexdigest()
-            self.ledger_path.write_text(json.dumps([genesis], indent=2), encoding="utf-8")
+            genesis["hash"] = block_hash(genesis)
+            LEDGER_CACHE.append(self.ledger_path, genesis)
+
+        # Memories stay resident between calls; the file stamp detects
+        # writes made by anyone else so the file is only re-read when it changed.
+        self._memories: List[Dict[str, Any]] = []
+        self._memories_stamp: Optional[FileStamp] = None
+        # Layer codes kept as a parallel byte array (index-aligned with
+        # ``_memories``) so promotion is a C-level translate/count, not a dict walk.
+        self._layers = bytearray()
 
     async def process(self, context) -> Dict[str, Any]:  # noqa: ANN001
-        memories: List[Dict[str, Any]] = await asyncio.to_thread(self._read_json, self.mem_path, [])
-
-        for entry in memories:
-            if entry.get("layer") == "L1":
-                entry["layer"] = "L2"
-        l2_count = sum(1 for entry in memories if entry.get("layer") == "L2")
-        if l2_count > 5:
-            for entry in memories:
-                if entry.get("layer") == "L2":
-                    entry["layer"] = "L3"
-
-        entry_id = f"mem_{uuid.uuid4().hex[:8]}"
+        now = iso_now()
+        memories = await self._run_blocking(self._load_memories)
+
+        self._layers = self._layers.translate(_PROMOTE_L1)
+        if self._layers.count(_L2) > 5:
+            self._layers = self._layers.translate(_PROMOTE_L2)
+
+        entry_id = f"mem_{os.urandom(4).hex()}"
         new_entry = {
             "id": entry_id,
-            "ts": _iso_now(),
+            "ts": now,
             "text": context.input_text or "",
             "layer": "L1",
             "tags": [context.user_id] if context.user_id else [],
         }
         memories.append(new_entry)
-        await asyncio.to_thread(self._write_json, self.mem_path, memories)
+        self._layers.append(_L1)
 
-        ledger_blocks: List[Dict[str, Any]] = await asyncio.to_thread(
-            self._read_json, self.ledger_path, []
-        )
-        previous_hash = ledger_blocks[-1]["hash"] if ledger_blocks else ""
         echo_res = context.agent_results.get("echo", {})
+        # ``ts`` and ``prev`` are reassigned (and ``hash`` added) by the ledger
+        # cache under its lock, so concurrent calls still extend a single chain.
         block = {
-            "ts": _iso_now(),
+            "ts": now,
             "kind": "input",
             "data": {
                 "text": context.input_text or "",
                 "styled_text": echo_res.get("styled_text", ""),
                 "glyph": echo_res.get("glyph", ""),
             },
-            "prev": previous_hash,
+            "prev": "",
         }
-        block["hash"] = hashlib.sha256(
-            json.dumps(block, sort_keys=True).encode("utf-8")
-        ).hexdigest()
-        ledger_blocks.append(block)
-        await asyncio.to_thread(self._write_json, self.ledger_path, ledger_blocks)
+        await self._run_blocking_batch(
+            [
+                (self._save_memories, (), {}),
+                (self._append_block, (block, entry_id), {}),
+            ]
+        )
 
         context.metadata["last_block_hash"] = block["hash"]
         context.metadata["memory_count"] = len(memories)
 
-        result = {"cached": True, "memory_id": entry_id, "layer": "L1", "block_hash": block["hash"]}
-        await self.append_log(
-            "limnus", {"memory_id": entry_id, "layer": "L1", "hash": block["hash"]}
-        )
-        return result
+        return {"cached": True, "memory_id": entry_id, "layer": "L1", "block_hash": block["hash"]}
+
+    def _append_block(self, block: Dict[str, Any], entry_id: str) -> None:
+        LEDGER_CACHE.append_next(self.ledger_path, block)
+        self.record.append_log("limnus", {"memory_id": entry_id, "layer": "L1", "hash": block["hash"]})
+
+    def _load_memories(self) -> List[Dict[str, Any]]:
+        stamp = stat_stamp(self.mem_path)
+        if stamp is None or stamp != self._memories_stamp:
+            self._memories = self._read_json(self.mem_path, [])
+            self._memories_stamp = stamp
+            self._layers = bytearray(
+                _LAYER_CODES.get(entry.get("layer"), 0) for entry in self._memories
+            )
+        return self._memories
+
+    def _save_memories(self) -> None:
+        for entry, code in zip(self._memories, self._layers):
+            if code:
+                entry["layer"] = _LAYER_NAMES[code]
+        self._write_json(self.mem_path, self._memories)
+        self._memories_stamp = stat_stamp(self.mem_path)
 
     @staticmethod
     def _read_json(path: "Path", default: Any) -> Any:
-        if not path.exists():
-            return default
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            with open(path, "rb", buffering=BUFFER_SIZE) as handle:
+                return loads(handle.read())
+        except (FileNotFoundError, json.JSONDecodeError):
             return default
 
     @staticmethod
     def _write_json(path: "Path", data: Any) -> None:
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        with atomic_writer(path) as handle:
+            handle.write(dumps_indented(data))
@@ -47,15 +47,17 @@ class VesselIndexAgent(BaseAgent):
         index["workspace_id"] = self.workspace_id
         index["summary"] = self._summarise(entries)
 
-        await self._write_index(index)
-        await self.append_log(
-            "vessel_index",
-            {
-                "entry_id": entry["id"],
-                "stage": entry["garden"].get("stage"),
-                "memory_id": entry["memory"].get("memory_id"),
-                "validation_passed": entry["validation"].get("passed"),
-            },
+        log_entry = {
+            "entry_id": entry["id"],
+            "stage": entry["garden"].get("stage"),
+            "memory_id": entry["memory"].get("memory_id"),
+            "validation_passed": entry["validation"].get("passed"),
+        }
+        await self._run_blocking_batch(
+            [
+                (self._write_index_sync, (index,), {}),
+                (self.record.append_log, ("vessel_index", log_entry), {}),
+            ]
         )
 
         context.metadata["vessel_index_count"] = len(entries)
@@ -84,9 +86,6 @@ class VesselIndexAgent(BaseAgent):
         except json.JSONDecodeError:
             return {"entries": []}
 
-    async def _write_index(self, index: Dict[str, Any]) -> None:
-        await asyncio.to_thread(self._write_index_sync, index)
-
     def _write_index_sync(self, index: Dict[str, Any]) -> None:
         self.index_path.parent.mkdir(parents=True, exist_ok=True)
         self.index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
@@ -24,23 +24,30 @@ import contextlib
 import json
 import logging
 import os
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import asyncpg
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 from redis.asyncio import Redis
 
+from library_core._json import dumps_compact
 from library_core.dictation import DictationSession, start_session
 from library_core.dictation.pipeline import MRPPipeline
 from workspace.manager import WorkspaceManager
 
 logger = logging.getLogger(__name__)
 
+_EVENT_BATCH_SIZE = 256
+_INSERT_EVENT_SQL = """
+    INSERT INTO collab_events (workspace_id, session_id, user_id, event_type, payload)
+    VALUES ($1, $2, $3, $4, $5)
+"""
+
 
 def _env(key: str, default: Optional[str]) -> Optional[str]:
     value = os.getenv(key)
@@ -64,6 +71,9 @@ class CollaborationConfig:
     )
     idle_timeout_seconds: float = 30.0
     sweep_interval_seconds: float = 5.0
+    memory_event_limit: int = 65536
+    event_queue_size: int = 4096
+    shutdown_drain_seconds: float = 10.0
 
 
 @dataclass(slots=True)
@@ -81,6 +91,15 @@ class ClientConnection:
         return f"{self.workspace_id}:{self.session_id}:{self.user_id}"
 
 
+@dataclass(slots=True)
+class _PendingEvent:
+    """A recorded event waiting to be persisted; the payload is encoded once."""
+
+    entry: Dict[str, Any]
+    payload_json: bytes
+    line: bytes  # the ``events.jsonl`` line, built around ``payload_json``
+
+
 class MRPRunRequest(BaseModel):
     """Request body for triggering an MRP pipeline run."""
 
@@ -126,9 +145,18 @@ class CollaborationServer:
         self._sweep_task: Optional[asyncio.Task[None]] = None
         self._stop_event = asyncio.Event()
 
+        # Events are persisted by a single background consumer in batches; the
+        # bounded queue makes producers wait instead of buffering without limit.
+        self._event_queue: asyncio.Queue[_PendingEvent] = asyncio.Queue(
+            maxsize=self._config.event_queue_size
+        )
+        self._event_task: Optional[asyncio.Task[None]] = None
+
         # In-memory fallbacks when Redis/PostgreSQL are disabled or unavailable.
         self._memory_presence: Dict[Tuple[str, str], datetime] = {}
-        self._memory_events: List[Dict[str, Any]] = []
+        # Bounded: once full, the oldest events are evicted (counted and logged).
+        self._memory_events: Deque[Dict[str, Any]] = deque(maxlen=self._config.memory_event_limit)
+        self._memory_events_evicted = 0
 
         self._workspace_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)  # type: ignore[arg-type]
 
@@ -170,12 +198,26 @@ class CollaborationServer:
 
         self._stop_event.clear()
         self._sweep_task = asyncio.create_task(self._heartbeat_sweeper())
+        self._event_task = asyncio.create_task(self._event_consumer())
 
     async def shutdown(self) -> None:
         """Tear down external services and background tasks."""
         self._stop_event.set()
 
-        for task in (self._redis_task, self._sweep_task):
+        # Clearing the task first makes events recorded from here on persist
+        # inline, so nothing is queued behind the drain and then cancelled.
+        event_task, self._event_task = self._event_task, None
+        if event_task:
+            try:
+                await asyncio.wait_for(self._event_queue.join(), self._config.shutdown_drain_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Gave up draining collaboration events after %.1fs; %d still queued",
+                    self._config.shutdown_drain_seconds,
+                    self._event_queue.qsize(),
+                )
+
+        for task in (self._redis_task, self._sweep_task, event_task):
             if task:
                 task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
@@ -199,6 +241,8 @@ class CollaborationServer:
         status = {
             "status": "ok",
             "clients": len(self._clients),
+            "event_backlog": self._event_queue.qsize(),
+            "events_evicted": self._memory_events_evicted,
             "services": {
                 "redis": "connected" if self._redis_pub else "offline",
                 "postgres": "connected" if self._pg_pool else "offline",
@@ -248,6 +292,20 @@ class CollaborationServer:
 
         return {"workspace_id": workspace_id, "active_users": len(users), "users": users}
 
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Iterate the in-memory event fallback without copying it."""
+        return iter(self._memory_events)
+
+    def snapshot_events(self) -> Tuple[Dict[str, Any], ...]:
+        """Return a frozen copy of the in-memory event fallback."""
+        return tuple(self._memory_events)
+
+    def drain_events(self) -> Tuple[Dict[str, Any], ...]:
+        """Hand over and clear buffered in-memory events for a single batched write."""
+        events = tuple(self._memory_events)
+        self._memory_events.clear()
+        return events
+
     async def run_mrp(self, workspace_id: str, body: MRPRunRequest) -> MRPRunResponse:
         """Trigger the MRP encoder for ``workspace_id``."""
         session = self._ensure_session(workspace_id, body.sessionId)
@@ -487,32 +545,98 @@ class CollaborationServer:
         event_type: str,
         payload: Dict[str, Any],
     ) -> None:
-        entry = {
+        # Encode the payload once; the JSONL mirror, PostgreSQL, and the
+        # in-memory fallback all reuse these bytes.
+        encoded = dumps_compact(payload)
+        entry: Dict[str, Any] = {
             "workspace_id": workspace_id,
             "session_id": session_id,
             "user_id": user_id,
             "event_type": event_type,
-            "payload": payload,
             "created_at": datetime.now(UTC).isoformat(),
         }
+        line = dumps_compact(entry)[:-1] + b',"payload":' + encoded + b"}\n"
+        entry["payload"] = payload
+        event = _PendingEvent(entry, encoded, line)
+        if self._event_task is None:
+            # Not started (or already shut down): persist inline.
+            await self._persist_events([event])
+        else:
+            await self._event_queue.put(event)
 
-        if self._pg_pool:
-            async with self._pg_pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO collab_events (workspace_id, session_id, user_id, event_type, payload)
-                    VALUES ($1, $2, $3, $4, $5)
-                    """,
-                    workspace_id,
-                    session_id,
-                    user_id,
-                    event_type,
-                    json.dumps(payload),
+    async def _event_consumer(self) -> None:
+        queue = self._event_queue
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < _EVENT_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                try:
+                    await self._persist_events(batch)
+                except Exception as exc:  # pragma: no cover - defensive
+                    logger.warning("Failed to persist %d collaboration events: %s", len(batch), exc)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+        except asyncio.CancelledError:  # pragma: no cover - expected on shutdown
+            pass
+
+    async def _persist_events(self, batch: List[_PendingEvent]) -> None:
+        # The JSONL mirror is written first and on its own, so a database
+        # failure cannot take it down with it (and vice versa).
+        lines: Dict[str, List[bytes]] = defaultdict(list)
+        for event in batch:
+            lines[event.entry["workspace_id"]].append(event.line)
+        for workspace_id, workspace_lines in lines.items():
+            try:
+                self._append_workspace_event(workspace_id, b"".join(workspace_lines))
+            except OSError as exc:  # pragma: no cover - defensive
+                logger.warning(
+                    "Failed to mirror %d events for %s: %s", len(workspace_lines), workspace_id, exc
                 )
-        else:
-            self._memory_events.append(entry)
 
-        self._append_workspace_event(workspace_id, entry)
+        if self._pg_pool:
+            await self._insert_events(batch)
+        else:
+            self._buffer_events(batch)
+
+    def _buffer_events(self, batch: List[_PendingEvent]) -> None:
+        events = self._memory_events
+        limit = self._config.memory_event_limit
+        overflow = len(events) + len(batch) - limit
+        if overflow > 0:
+            if not self._memory_events_evicted:
+                logger.warning("In-memory event buffer is full (%d); evicting the oldest events", limit)
+            self._memory_events_evicted += overflow
+        events.extend(event.entry for event in batch)
+
+    async def _insert_events(self, batch: List[_PendingEvent]) -> None:
+        assert self._pg_pool is not None
+        rows = [
+            (
+                event.entry["workspace_id"],
+                event.entry["session_id"],
+                event.entry["user_id"],
+                event.entry["event_type"],
+                event.payload_json.decode("utf-8"),
+            )
+            for event in batch
+        ]
+        async with self._pg_pool.acquire() as conn:
+            try:
+                # executemany runs in one implicit transaction, so a failure
+                # leaves nothing behind and every row can be retried.
+                await conn.executemany(_INSERT_EVENT_SQL, rows)
+                return
+            except Exception as exc:
+                logger.warning(
+                    "Batch insert of %d events failed (%s); retrying row by row", len(rows), exc
+                )
+            for row in rows:
+                try:
+                    await conn.execute(_INSERT_EVENT_SQL, *row)
+                except Exception as exc:
+                    logger.warning("Dropping %s event for %s: %s", row[3], row[0], exc)
 
     async def _update_presence(self, workspace_id: str, user_id: str) -> None:
         timestamp = datetime.now(UTC)
@@ -574,12 +698,12 @@ class CollaborationServer:
         except Exception as exc:  # pragma: no cover - defensive
             logger.debug("Redis publish failed: %s", exc)
 
-    def _append_workspace_event(self, workspace_id: str, payload: Dict[str, Any]) -> None:
+    def _append_workspace_event(self, workspace_id: str, lines: bytes) -> None:
         record = self._manager.get(workspace_id)
         events_path = record.path / "collab" / "events.jsonl"
         events_path.parent.mkdir(parents=True, exist_ok=True)
-        with events_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        with events_path.open("ab") as handle:
+            handle.write(lines)
 
     async def _redis_listener(self) -> None:
         if not self._redis_sub:
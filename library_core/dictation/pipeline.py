@@ -12,6 +12,12 @@ from typing import Optional
 
 from .session import DictationSession
 
+# Submodule locations are resolved once at import rather than per pipeline run.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MRP_ROOT = REPO_ROOT / "vessel-narrative-MRP"
+GARDEN_ROOT = REPO_ROOT / "The-Living_Garden-Chronicles"
+KIRA_ROOT = REPO_ROOT / "kira-prime"
+
 
 class MRPPipeline:
     """
@@ -27,10 +33,10 @@ class MRPPipeline:
 
     def __init__(self, session: DictationSession) -> None:
         self.session = session
-        self.root = Path(__file__).resolve().parents[2]
-        self.mrp_root = self.root / "vessel-narrative-MRP"
-        self.garden_root = self.root / "The-Living_Garden-Chronicles"
-        self.kira_root = self.root / "kira-prime"
+        self.root = REPO_ROOT
+        self.mrp_root = MRP_ROOT
+        self.garden_root = GARDEN_ROOT
+        self.kira_root = KIRA_ROOT
 
     # ------------------------------------------------------------------ public
 
@@ -8,7 +8,7 @@ are stored in JSON Lines format under the workspace logs directory.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import json
 from pathlib import Path
@@ -34,7 +34,14 @@ class DictationTurn:
     metadata: Mapping[str, str] | None = None
 
     def to_dict(self) -> MutableMapping[str, object]:
-        data = asdict(self)
+        # Built field by field: ``asdict`` deep-copies recursively on every turn.
+        data = {
+            "speaker": self.speaker,
+            "text": self.text,
+            "timestamp": self.timestamp,
+            "tags": dict(self.tags) if self.tags else None,
+            "metadata": dict(self.metadata) if self.metadata else None,
+        }
         # Filter empty optional fields for cleaner storage.
         return {key: value for key, value in data.items() if value}
 
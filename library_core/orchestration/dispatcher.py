@@ -4,22 +4,77 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from library_core._files import FileStamp, stat_stamp
+from library_core._json import loads
 from library_core.agents import EchoAgent, GardenAgent, KiraAgent, LimnusAgent
 from library_core.storage import StorageManager
 from pipeline.intent_parser import IntentParser, ParsedIntent
 from pipeline.logger import PipelineLogger
 from workspace.manager import WorkspaceManager
 
+_TAIL_WINDOW = 8192
+
 
 def _timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _read_last_record(path: str, size: int) -> Optional[Dict[str, Any]]:
+    """
+    Decode only the final object of a JSON array file.
+
+    Reads a tail window and tries each ``{`` before the last ``}``, right to
+    left, until one slice decodes as a single value; braces inside strings
+    simply fail to decode and are skipped. The window doubles until the
+    record fits, so cost tracks the record size rather than the history.
+    """
+    window = _TAIL_WINDOW
+    with open(path, "rb") as handle:
+        while True:
+            start = max(0, size - window)
+            handle.seek(start)
+            tail = handle.read(size - start)
+            end = tail.rfind(b"}")
+            pos = end
+            while end != -1:
+                pos = tail.rfind(b"{", 0, pos)
+                if pos == -1:
+                    break
+                try:
+                    return loads(tail[pos : end + 1])
+                except json.JSONDecodeError:
+                    continue
+            if start == 0:
+                return None
+            window *= 2
+
+
+@lru_cache(maxsize=512)
+def _load_limnus_tail(path: str, stamp: FileStamp) -> Tuple[Optional[str], str]:
+    """Return ``(id, layer)`` of the newest memory; keyed on the file's stat stamp."""
+    last = _read_last_record(path, stamp.size)
+    if last is None:
+        return None, "L2"
+    return last.get("id"), last.get("layer", "L2")
+
+
+def _load_echo_mode(path: str) -> Optional[str]:
+    """Return the persisted Echo ``last_mode``, or ``None`` when there is no state file."""
+    try:
+        with open(path, "rb") as handle:
+            data = loads(handle.read())
+    except FileNotFoundError:
+        return None
+    return data.get("last_mode", "balanced")
+
+
 @dataclass(slots=True)
 class PrimeContext:
     input_text: str
@@ -39,6 +94,9 @@ class PrimeDispatcher:
         self.manager = manager or WorkspaceManager()
         self.record = self.manager.get(workspace_id)
         self._ensure_state_dirs()
+        state_dir = os.path.join(str(self.record.path), "state")
+        self._echo_state_path = os.path.join(state_dir, "echo_state.json")
+        self._limnus_mem_path = os.path.join(state_dir, "limnus_memory.json")
 
         storage = StorageManager(self.record.path)
         self.garden = GardenAgent(self.workspace_id, storage, self.manager)
@@ -66,30 +124,30 @@ class PrimeDispatcher:
         asyncio.run(self.logger.log_start(context))
 
         try:
-        garden_result = self._process_garden(context)
-        context.agent_results["garden"] = garden_result
-        asyncio.run(self.logger.log_agent_step("garden", context, garden_result))
+            garden_result = self._process_garden(context)
+            context.agent_results["garden"] = garden_result
+            asyncio.run(self.logger.log_agent_step("garden", context, garden_result))
         except Exception as exc:  # pragma: no cover - defensive
             context.errors.append(f"garden: {exc}")
 
         try:
-        echo_result = self._process_echo(context)
-        context.agent_results["echo"] = echo_result
-        asyncio.run(self.logger.log_agent_step("echo", context, echo_result))
+            echo_result = self._process_echo(context)
+            context.agent_results["echo"] = echo_result
+            asyncio.run(self.logger.log_agent_step("echo", context, echo_result))
         except Exception as exc:  # pragma: no cover - defensive
             context.errors.append(f"echo: {exc}")
 
         try:
-        limnus_result = self._process_limnus(context)
-        context.agent_results["limnus"] = limnus_result
-        asyncio.run(self.logger.log_agent_step("limnus", context, limnus_result))
+            limnus_result = self._process_limnus(context)
+            context.agent_results["limnus"] = limnus_result
+            asyncio.run(self.logger.log_agent_step("limnus", context, limnus_result))
         except Exception as exc:  # pragma: no cover - defensive
             context.errors.append(f"limnus: {exc}")
 
         try:
-        kira_result = self._process_kira(context)
-        context.agent_results["kira"] = kira_result
-        asyncio.run(self.logger.log_agent_step("kira", context, kira_result))
+            kira_result = self._process_kira(context)
+            context.agent_results["kira"] = kira_result
+            asyncio.run(self.logger.log_agent_step("kira", context, kira_result))
         except Exception as exc:  # pragma: no cover - defensive
             context.errors.append(f"kira: {exc}")
 
@@ -108,28 +166,20 @@ class PrimeDispatcher:
         # Allow the agent to adapt weights then produce styled text.
         self.echo.learn(context.input_text)
         styled = self.echo.say(context.input_text)
-        state_path = self.record.path / "state" / "echo_state.json"
         persona = "balanced"
         tone = "neutral"
-        if state_path.exists():
-            data = json.loads(state_path.read_text(encoding="utf-8"))
-            persona = data.get("last_mode", "balanced")
-            tone = persona
+        mode = _load_echo_mode(self._echo_state_path)
+        if mode is not None:
+            persona = tone = mode
         return {"styled_text": styled, "persona": persona, "style": {"tone": tone}}
 
     def _process_limnus(self, context: PrimeContext) -> Dict[str, Any]:
         self.limnus.cache(context.input_text, tags=[context.user_id])
-        mem_path = self.record.path / "state" / "limnus_memory.json"
-        memory_id = None
-        if mem_path.exists():
-            entries = json.loads(mem_path.read_text(encoding="utf-8"))
-            if entries:
-                memory_id = entries[-1].get("id")
-                layer = entries[-1].get("layer", "L2")
-            else:
-                layer = "L2"
-        else:
-            layer = "L2"
+        mem_path = self._limnus_mem_path
+        memory_id, layer = None, "L2"
+        stamp = stat_stamp(mem_path)
+        if stamp is not None and stamp.size:
+            memory_id, layer = _load_limnus_tail(mem_path, stamp)
         return {"cached": True, "memory_id": memory_id, "layer": layer}
 
     def _process_kira(self, context: PrimeContext) -> Dict[str, Any]:
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from library_core._keywords import KeywordMatcher
+
 from .intent_parser import IntentParser, ParsedIntent
 from .logger import PipelineLogger
 
@@ -38,7 +40,7 @@ class _GardenAgent:
         if not stage:
             stage = self.parser._detect_stage(context.input_text.lower()) or "scatter"
         self.cycle += 1
-        mantra = next((m for m in self.parser.MANTRAS if m in context.input_text.lower()), None)
+        mantra = self.parser.MANTRA_MATCHER.first(context.input_text.lower())
         result = {"stage": stage, "cycle": self.cycle, "mantra_detected": bool(mantra)}
         context.garden_result = result
         return result
@@ -50,14 +52,10 @@ class _EchoAgent:
         "fox": ("debug", "analyze", "solve"),
         "paradox": ("meaning", "mystery", "why"),
     }
+    PERSONA_MATCHER = KeywordMatcher(PERSONA_KEYWORDS)
 
     async def process(self, context: PipelineContext) -> Dict[str, Any]:
-        persona = "balanced"
-        lowered = context.input_text.lower()
-        for name, keywords in self.PERSONA_KEYWORDS.items():
-            if any(keyword in lowered for keyword in keywords):
-                persona = name
-                break
+        persona = self.PERSONA_MATCHER.first(context.input_text.lower()) or "balanced"
         result = {
             "styled_text": context.input_text,
             "persona": persona,
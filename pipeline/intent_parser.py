@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
+from library_core._keywords import KeywordMatcher
+
 
 @dataclass(slots=True)
 class ParsedIntent:
@@ -29,6 +31,8 @@ class IntentParser:
         "tend": ("tend", "refine", "improve"),
         "harvest": ("harvest", "complete", "finish"),
     }
+    MANTRA_MATCHER = KeywordMatcher({mantra: (mantra,) for mantra in MANTRAS})
+    STAGE_MATCHER = KeywordMatcher(STAGE_KEYWORDS)
 
     def parse(self, text: str) -> ParsedIntent:
         normalised = text.lower().strip()
@@ -36,7 +40,7 @@ class IntentParser:
         if text.startswith(self.COMMAND_PREFIX):
             return self._parse_command(text)
 
-        mantra = next((m for m in self.MANTRAS if m in normalised), None)
+        mantra = self.MANTRA_MATCHER.first(normalised)
         if mantra:
             return ParsedIntent(
                 intent_type="ritual",
@@ -63,7 +67,4 @@ class IntentParser:
         return ParsedIntent(intent_type="command", command=command, args={"args": args}, raw_text=text)
 
     def _detect_stage(self, text: str) -> Optional[str]:
-        for stage, keywords in self.STAGE_KEYWORDS.items():
-            if any(keyword in text for keyword in keywords):
-                return stage
-        return None
+        return self.STAGE_MATCHER.first(text)
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
 
 from workspace.manager import WorkspaceManager
 
+_TAIL_BYTES = 64
+
+_EVENT_START = "pipeline_start"
+_EVENT_STEP = "agent_step"
+_EVENT_COMPLETE = "pipeline_complete"
+
+# ``json.dumps`` with non-default options builds a fresh encoder on every call.
+_ENCODER = json.JSONEncoder(indent=2)
+
 
 class PipelineLogger:
     """Persist pipeline activity to the workspace `voice_log.json`."""
@@ -23,7 +33,7 @@ class PipelineLogger:
     async def log_start(self, context) -> None:  # noqa: ANN001
         self._append(
             {
-                "event": "pipeline_start",
+                "event": _EVENT_START,
                 "timestamp": context.timestamp,
                 "user_id": context.user_id,
                 "workspace_id": context.workspace_id,
@@ -35,7 +45,7 @@ class PipelineLogger:
     async def log_agent_step(self, agent_name: str, context, result: Dict[str, Any]) -> None:  # noqa: ANN001
         self._append(
             {
-                "event": "agent_step",
+                "event": _EVENT_STEP,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "agent": agent_name,
                 "user_id": context.user_id,
@@ -46,7 +56,7 @@ class PipelineLogger:
     async def log_complete(self, context, response: Dict[str, Any]) -> None:  # noqa: ANN001
         self._append(
             {
-                "event": "pipeline_complete",
+                "event": _EVENT_COMPLETE,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "user_id": context.user_id,
                 "success": response["success"],
@@ -62,9 +72,30 @@ class PipelineLogger:
             self._log_path.write_text("[]", encoding="utf-8")
 
     def _append(self, entry: Dict[str, Any]) -> None:
+        # Splice the entry in front of the closing bracket instead of re-reading
+        # and rewriting the whole log; the bytes match ``json.dumps(logs, indent=2)``.
+        chunk = _ENCODER.encode([entry]).encode("utf-8")  # b"[\n  {...}\n]"
+        with self._log_path.open("r+b") as handle:
+            size = handle.seek(0, os.SEEK_END)
+            tail_start = max(0, size - _TAIL_BYTES)
+            handle.seek(tail_start)
+            tail = handle.read()
+            close = tail.rfind(b"]")
+            if close == -1 or tail[close + 1 :].strip():
+                self._rewrite(entry)
+                return
+            head = tail[:close].rstrip()
+            handle.seek(tail_start + len(head))
+            handle.truncate()
+            if head.endswith(b"["):
+                handle.write(chunk[1:])
+            else:
+                handle.write(b"," + chunk[1:])
+
+    def _rewrite(self, entry: Dict[str, Any]) -> None:
         logs = self._read()
         logs.append(entry)
-        self._log_path.write_text(json.dumps(logs, indent=2), encoding="utf-8")
+        self._log_path.write_text(_ENCODER.encode(logs), encoding="utf-8")
 
     def _read(self) -> List[Dict[str, Any]]:
         try:
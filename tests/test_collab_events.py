@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from pathlib import Path
+
+import pytest
+
+from library_core.collab import CollaborationConfig, CollaborationServer
+from workspace.manager import WorkspaceManager
+
+
+def _server(tmp_path: Path, **overrides: object) -> CollaborationServer:
+    config = CollaborationConfig(redis_url=None, postgres_dsn=None, **overrides)
+    return CollaborationServer(manager=WorkspaceManager(root=tmp_path), config=config)
+
+
+def test_memory_events_keep_payload_dicts(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    payload = {"agent": "echo", "result": {"n": 1}}
+
+    asyncio.run(server._record_event("alpha", "demo", "alice", "agent_result", payload))
+
+    (event,) = server.iter_events()
+    assert event["payload"] == payload
+    assert event["event_type"] == "agent_result"
+
+
+def _lines(tmp_path: Path, workspace_id: str = "alpha") -> list[dict]:
+    path = tmp_path / "workspaces" / workspace_id / "collab" / "events.jsonl"
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+async def _record_many(server: CollaborationServer, count: int, event_type: str = "note") -> None:
+    await asyncio.gather(
+        *(server._record_event("alpha", "demo", "alice", event_type, {"i": i}) for i in range(count))
+    )
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_queued_events(tmp_path: Path) -> None:
+    server = _server(tmp_path, event_queue_size=16)
+    await server.startup()
+    await _record_many(server, 600)
+    await server.shutdown()
+
+    assert [entry["payload"]["i"] for entry in _lines(tmp_path)] == list(range(600))
+    assert len(server.snapshot_events()) == 600
+
+
+@pytest.mark.asyncio
+async def test_consumer_persists_in_bounded_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    server = _server(tmp_path)
+    sizes: list[int] = []
+    persist = server._persist_events
+
+    async def spy(batch: list) -> None:
+        sizes.append(len(batch))
+        await persist(batch)
+
+    monkeypatch.setattr(server, "_persist_events", spy)
+    await server.startup()
+    await _record_many(server, 600)
+    await server.shutdown()
+
+    assert sum(sizes) == 600
+    assert max(sizes) == 256
+    assert len(sizes) < 600
+
+
+@pytest.mark.asyncio
+async def test_full_queue_makes_producers_wait(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    server = _server(tmp_path, event_queue_size=2)
+    gate = asyncio.Event()
+    persist = server._persist_events
+
+    async def blocked(batch: list) -> None:
+        await gate.wait()
+        await persist(batch)
+
+    monkeypatch.setattr(server, "_persist_events", blocked)
+    await server.startup()
+    producers = [
+        asyncio.create_task(server._record_event("alpha", "demo", "alice", "note", {"i": i}))
+        for i in range(6)
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert server._event_queue.qsize() == 2
+    assert not all(task.done() for task in producers)
+
+    gate.set()
+    await asyncio.gather(*producers)
+    await server.shutdown()
+    assert len(_lines(tmp_path)) == 6
+
+
+@pytest.mark.asyncio
+async def test_events_recorded_during_shutdown_persist_inline(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    server = _server(tmp_path)
+    gate = asyncio.Event()
+    persist = server._persist_events
+
+    async def blocked(batch: list) -> None:
+        await gate.wait()
+        await persist(batch)
+
+    monkeypatch.setattr(server, "_persist_events", blocked)
+    await server.startup()
+    await server._record_event("alpha", "demo", "alice", "note", {"i": 0})
+    stopping = asyncio.create_task(server.shutdown())
+    await asyncio.sleep(0)
+
+    late = asyncio.create_task(server._record_event("alpha", "demo", "alice", "note", {"i": 1}))
+    await asyncio.sleep(0)
+    assert server._event_queue.qsize() == 0  # went inline, not behind the drain
+
+    gate.set()
+    await asyncio.gather(stopping, late)
+    assert sorted(entry["payload"]["i"] for entry in _lines(tmp_path)) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_gives_up_on_a_hung_drain(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    server = _server(tmp_path, shutdown_drain_seconds=0.05)
+
+    async def hung(batch: list) -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(server, "_persist_events", hung)
+    await server.startup()
+    await _record_many(server, 3)
+
+    await server.shutdown()
+    assert "Gave up draining collaboration events" in caplog.text
+
+
+class _FlakyConnection:
+    def __init__(self) -> None:
+        self.rows: list[tuple] = []
+
+    async def executemany(self, sql: str, rows: list) -> None:
+        raise RuntimeError("batch rejected")
+
+    async def execute(self, sql: str, *row: object) -> None:
+        if row[3] == "bad":
+            raise RuntimeError("row rejected")
+        self.rows.append(row)
+
+
+class _FlakyPool:
+    def __init__(self) -> None:
+        self.conn = _FlakyConnection()
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):  # type: ignore[no-untyped-def]
+        yield self.conn
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_insert_keeps_mirror_and_retries_rows(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    pool = _FlakyPool()
+    await server.startup()
+    server._pg_pool = pool  # type: ignore[assignment]
+    await asyncio.gather(
+        server._record_event("alpha", "demo", "alice", "good", {"i": 0}),
+        server._record_event("alpha", "demo", "alice", "bad", {"i": 1}),
+        server._record_event("alpha", "demo", "alice", "good", {"i": 2}),
+    )
+    await server.shutdown()
+
+    assert [entry["event_type"] for entry in _lines(tmp_path)] == ["good", "bad", "good"]
+    assert [json.loads(row[4]) for row in pool.conn.rows] == [{"i": 0}, {"i": 2}]
+
+
+def test_drain_hands_over_and_clears_buffer(tmp_path: Path) -> None:
+    server = _server(tmp_path)
+    asyncio.run(_record_many(server, 3))
+
+    snapshot = server.snapshot_events()
+    drained = server.drain_events()
+
+    assert [event["payload"]["i"] for event in drained] == [0, 1, 2]
+    assert snapshot == drained
+    assert list(server.iter_events()) == []
+    assert server.drain_events() == ()
+
+
+def test_full_buffer_evicts_oldest_and_counts(tmp_path: Path) -> None:
+    server = _server(tmp_path, memory_event_limit=4)
+    asyncio.run(_record_many(server, 10))
+
+    assert [event["payload"]["i"] for event in server.iter_events()] == [6, 7, 8, 9]
+    assert asyncio.run(server.health())["events_evicted"] == 6
+    # The JSONL mirror is unaffected by the in-memory bound.
+    assert len(_lines(tmp_path)) == 10
+
+
+@pytest.mark.asyncio
+async def test_batch_larger_than_buffer_counts_every_eviction(tmp_path: Path) -> None:
+    server = _server(tmp_path, memory_event_limit=4)
+    await server.startup()
+    await _record_many(server, 20)
+    await server.shutdown()
+
+    assert [event["payload"]["i"] for event in server.iter_events()] == [16, 17, 18, 19]
+    assert (await server.health())["events_evicted"] == 16
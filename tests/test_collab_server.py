@@ -76,3 +76,25 @@ def test_mrp_endpoint_runs_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: P
     meta_path = tmp_path / "workspaces" / "alpha" / "logs" / "dictation_demo.meta.json"
     metadata = json.loads(meta_path.read_text(encoding="utf-8"))
     assert metadata["mrp_output"] == payload["outputPath"]
+
+
+def test_agent_result_with_values_orjson_cannot_encode(tmp_path: Path) -> None:
+    manager = WorkspaceManager(root=tmp_path)
+    config = CollaborationConfig(redis_url=None, postgres_dsn=None)
+    app = create_app(manager=manager, config=config)
+
+    big = 123456789012345678901234567890
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws?workspaceId=alpha&userId=alice&sessionId=demo") as ws:
+            ws.send_text(json.dumps({"type": "agent_result", "agent": "x", "result": big}))
+            ws.send_text('{"type": "agent_result", "agent": "y", "result": [Infinity, "half \\ud83d"]}')
+            ws.send_json({"type": "ping"})
+            assert ws.receive_json()["type"] == "pong"
+
+    events_path = tmp_path / "workspaces" / "alpha" / "collab" / "events.jsonl"
+    results = {
+        entry["payload"]["agent"]: entry["payload"]["result"]
+        for entry in _read_jsonl(events_path)
+        if entry["event_type"] == "agent_result"
+    }
+    assert results == {"x": big, "y": [float("inf"), "half \ud83d"]}
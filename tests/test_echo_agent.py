@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from library_core.agents import EchoAgent
+from library_core.storage import StorageManager
+from workspace.manager import WorkspaceManager
+
+
+def _reference(user_text: str) -> Tuple[Dict[str, float], str]:
+    # The original per-call arithmetic, used as the reference.
+    alpha, beta, gamma = 0.3, 0.3, 0.4
+    lower = user_text.lower()
+    if len(user_text) > 120:
+        beta += 0.2
+    if any(keyword in lower for keyword in EchoAgent.PERSONA_KEYWORDS["paradox"]):
+        gamma += 0.2
+    if len(user_text) < 40:
+        alpha += 0.1
+    total = alpha + beta + gamma or 1.0
+    alpha, beta, gamma = alpha / total, beta / total, gamma / total
+    persona = "paradox"
+    if alpha >= beta and alpha >= gamma:
+        persona = "squirrel"
+    elif beta > alpha and beta >= gamma:
+        persona = "fox"
+    return {"alpha": round(alpha, 3), "beta": round(beta, 3), "gamma": round(gamma, 3)}, persona
+
+
+def _echo(tmp_path: Path) -> EchoAgent:
+    manager = WorkspaceManager(root=tmp_path)
+    record = manager.get("echo")
+    return EchoAgent("echo", StorageManager(record.path), manager)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "a short note",
+        "why?",
+        "The MYSTERY deepens",
+        "QuAnTuM",
+        "x" * 39,
+        "x" * 40,
+        "x" * 120,
+        "x" * 121,
+        "a long line about a spiral " * 6,
+        "a long line with no keywords at all " * 5,
+        "myſtery",
+        "ſpiral",
+        "SPİRAL",
+    ],
+)
+def test_mode_weights_match_original_arithmetic(tmp_path: Path, text: str) -> None:
+    context: Any = SimpleNamespace(input_text=text, metadata={})
+    asyncio.run(_echo(tmp_path).process(context))
+
+    state, persona = _reference(text)
+    assert context.metadata["mode_weights"] == state
+    assert context.metadata["dominant_persona"] == persona
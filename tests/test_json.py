@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import math
+
+import pytest
+
+from library_core import _json
+from library_core._json import dumps_compact, dumps_indented
+
+
+def test_dumps_compact_round_trips_plain_values() -> None:
+    value = {"b": 1, "a": ["é", 2.5, True, None], "c": {}}
+    data = dumps_compact(value)
+    assert json.loads(data) == value
+    assert list(json.loads(data)) == ["b", "a", "c"]
+    assert b" " not in data
+
+
+def test_dumps_compact_falls_back_for_values_orjson_rejects_or_alters() -> None:
+    big = 2**64 + 1
+    assert json.loads(dumps_compact({"n": big})) == {"n": big}
+    assert json.loads(dumps_compact({"s": "half \ud83d pair"})) == {"s": "half \ud83d pair"}
+
+    decoded = json.loads(dumps_compact([math.inf, -math.inf, math.nan]))
+    assert decoded[:2] == [math.inf, -math.inf]
+    assert math.isnan(decoded[2])
+
+
+def test_none_values_stay_on_the_orjson_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> str:
+        raise AssertionError("fell back to json.dumps")
+
+    monkeypatch.setattr(_json.json, "dumps", fail)
+    value = {"a": None, "b": [1.5, None, {"c": "null"}]}
+    assert json.loads(dumps_compact(value)) == value
+    assert json.loads(dumps_indented(value)) == value
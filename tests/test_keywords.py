@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional, Sequence, Set
+
+from library_core._keywords import KeywordMatcher
+from library_core.agents.garden_agent import GardenAgent
+
+
+def _brute_labels(table: Dict[str, Sequence[str]], text: str) -> Set[str]:
+    return {label for label, words in table.items() if any(word in text for word in words)}
+
+
+def _brute_first(table: Dict[str, Sequence[str]], text: str) -> Optional[str]:
+    for label, words in table.items():
+        if any(word in text for word in words):
+            return label
+    return None
+
+
+def test_nested_keyword_inside_longer_match() -> None:
+    table = GardenAgent.STAGE_KEYWORDS
+    matcher = KeywordMatcher(table)
+
+    text = "let us begin again"
+    assert matcher.labels(text) == {"scatter", "begin_again"} == _brute_labels(table, text)
+    assert matcher.first(text) == "scatter"
+    assert matcher.first("restart the new cycle") == "return"  # "cycle" sits inside "new cycle"
+    assert matcher.first("nothing here") is None
+
+
+def test_overlapping_keywords_share_positions() -> None:
+    table = {"short": ("ab",), "long": ("abc",), "tail": ("bcd",)}
+    matcher = KeywordMatcher(table)
+    assert matcher.labels("xabcdx") == {"short", "long", "tail"}
+    assert matcher.first("xbcdx") == "tail"
+
+
+def test_matches_brute_force_loops() -> None:
+    rng = random.Random(1234)
+    alphabet = "ab c"
+    for _ in range(200):
+        table = {
+            f"label{index}": tuple(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 3))
+            )
+            for index in range(rng.randint(1, 5))
+        }
+        matcher = KeywordMatcher(table)
+        for _ in range(20):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            assert matcher.labels(text) == _brute_labels(table, text), (table, text)
+            assert matcher.first(text) == _brute_first(table, text), (table, text)
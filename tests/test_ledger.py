@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from library_core._hashing import sha256_hex
+from library_core.agents import KiraAgent, LimnusAgent
+from library_core.agents._ledger import LEDGER_FILE, block_hash, iter_blocks
+from library_core.storage import StorageManager
+from workspace.manager import WorkspaceManager
+
+
+def _context(text: str) -> SimpleNamespace:
+    return SimpleNamespace(input_text=text, user_id="tester", agent_results={}, metadata={})
+
+
+def _agents(tmp_path: Path) -> tuple[LimnusAgent, KiraAgent, Path]:
+    manager = WorkspaceManager(root=tmp_path)
+    record = manager.get("ledger")
+    storage = StorageManager(record.path)
+    record.save_state("garden", {"ledger": {"entries": [{"kind": "consent"}]}})
+    return (
+        LimnusAgent("ledger", storage, manager),
+        KiraAgent("ledger", storage, manager),
+        record.path / LEDGER_FILE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_limnus_appends_chain_that_kira_accepts(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+
+    for text in ("first seed", "second seed", "third seed"):
+        await limnus.process(_context(text))
+
+    blocks = list(iter_blocks(ledger_path))
+    assert len(blocks) == 4
+    assert blocks[0]["kind"] == "genesis"
+    assert all(block["prev"] == prev["hash"] for prev, block in zip(blocks, blocks[1:]))
+
+    result = await kira.process(_context("validate"))
+    assert result == {"passed": True, "issues": []}
+
+
+@pytest.mark.asyncio
+async def test_kira_flags_tampered_block(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+    await limnus.process(_context("original"))
+    assert (await kira.process(_context("validate")))["passed"] is True
+
+    lines = ledger_path.read_text(encoding="utf-8").splitlines()
+    tampered = json.loads(lines[1])
+    tampered["data"]["text"] = "rewritten"
+    lines[1] = json.dumps(tampered)
+    ledger_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = await kira.process(_context("validate"))
+    assert result["passed"] is False
+    assert "Hash mismatch at block 1" in result["issues"]
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_ledger_is_migrated_and_verifies(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+    ledger_path.unlink()
+    genesis = {"ts": "2025-01-01T00:00:00Z", "kind": "genesis", "data": {"anchor": "é"}, "prev": ""}
+    # Hashed exactly as the pre-JSONL ledger did.
+    genesis["hash"] = sha256_hex(json.dumps(genesis, sort_keys=True).encode("utf-8"))
+    legacy_path = ledger_path.with_name("ledger.json")
+    legacy_path.write_text(json.dumps([genesis], indent=2), encoding="utf-8")
+
+    limnus = LimnusAgent("ledger", limnus.storage, limnus.manager)
+    await limnus.process(_context("after migration"))
+
+    blocks = list(iter_blocks(ledger_path))
+    assert blocks[0] == genesis
+    assert blocks[1]["prev"] == genesis["hash"]
+    assert blocks[1]["hash"] == block_hash(blocks[1])
+    assert (await kira.process(_context("validate")))["passed"] is True
+
+
+@pytest.mark.asyncio
+async def test_unencodable_text_is_hashed_and_stored(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+    text = json.loads('"half \\ud83d pair"')
+
+    await limnus.process(_context(text))
+
+    blocks = list(iter_blocks(ledger_path))
+    assert blocks[-1]["data"]["text"] == text
+    assert (await kira.process(_context("validate")))["passed"] is True
+
+
+@pytest.mark.asyncio
+async def test_kira_detects_same_size_edit_with_restored_mtime(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+    await limnus.process(_context("original"))
+    assert (await kira.process(_context("validate")))["passed"] is True
+
+    before = ledger_path.stat()
+    raw = ledger_path.read_bytes()
+    ledger_path.write_bytes(raw.replace(b"original", b"0riginal"))
+    os.utime(ledger_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert ledger_path.stat().st_size == before.st_size
+
+    result = await kira.process(_context("validate"))
+    assert "Hash mismatch at block 1" in result["issues"]
+
+
+@pytest.mark.asyncio
+async def test_kira_reads_unmigrated_legacy_ledger(tmp_path: Path) -> None:
+    manager = WorkspaceManager(root=tmp_path)
+    record = manager.get("legacy")
+    record.save_state("garden", {"ledger": {"entries": [{"kind": "consent"}]}})
+    genesis = {"ts": "2025-01-01T00:00:00Z", "kind": "genesis", "data": {}, "prev": ""}
+    genesis["hash"] = block_hash(genesis)
+    (record.path / "state" / "ledger.json").write_text(json.dumps([genesis], indent=2), encoding="utf-8")
+
+    kira = KiraAgent("legacy", StorageManager(record.path), manager)
+
+    assert await kira.process(_context("validate")) == {"passed": True, "issues": []}
+    assert not (record.path / LEDGER_FILE).exists()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_process_calls_write_memory_file(tmp_path: Path) -> None:
+    limnus, _, _ = _agents(tmp_path)
+
+    results = await asyncio.gather(*(limnus.process(_context(f"seed {index}")) for index in range(20)))
+
+    memories = json.loads(limnus.mem_path.read_text(encoding="utf-8"))
+    assert {entry["id"] for entry in memories} == {result["memory_id"] for result in results}
+    assert not list(limnus.mem_path.parent.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_process_calls_extend_one_chain(tmp_path: Path) -> None:
+    limnus, kira, ledger_path = _agents(tmp_path)
+    other = LimnusAgent("ledger", limnus.storage, limnus.manager)
+
+    await asyncio.gather(
+        *(agent.process(_context(f"seed {index}")) for index in range(10) for agent in (limnus, other))
+    )
+
+    blocks = list(iter_blocks(ledger_path))
+    assert len(blocks) == 21
+    assert all(block["prev"] == prev["hash"] for prev, block in zip(blocks, blocks[1:]))
+    assert await kira.process(_context("validate")) == {"passed": True, "issues": []}
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from library_core.agents import LimnusAgent
+from library_core.storage import StorageManager
+from workspace.manager import WorkspaceManager
+
+
+def _context(text: str) -> SimpleNamespace:
+    return SimpleNamespace(input_text=text, user_id="tester", agent_results={}, metadata={})
+
+
+def _limnus(tmp_path: Path) -> LimnusAgent:
+    manager = WorkspaceManager(root=tmp_path)
+    record = manager.get("memory")
+    return LimnusAgent("memory", StorageManager(record.path), manager)
+
+
+def _layers(agent: LimnusAgent) -> List[Any]:
+    return [entry.get("layer") for entry in json.loads(agent.mem_path.read_text(encoding="utf-8"))]
+
+
+def _promote(layers: List[Any]) -> List[Any]:
+    # The original per-entry dict walk, used as the reference.
+    memories: List[Dict[str, Any]] = [{"layer": layer} for layer in layers]
+    for memory in memories:
+        if memory["layer"] == "L1":
+            memory["layer"] = "L2"
+    if sum(1 for memory in memories if memory["layer"] == "L2") > 5:
+        for memory in memories:
+            if memory["layer"] == "L2":
+                memory["layer"] = "L3"
+    return [memory["layer"] for memory in memories] + ["L1"]
+
+
+def test_promotion_matches_the_per_entry_walk(tmp_path: Path) -> None:
+    limnus = _limnus(tmp_path)
+    expected: List[Any] = []
+    for index in range(15):
+        asyncio.run(limnus.process(_context(f"seed {index}")))
+        expected = _promote(expected)
+        assert _layers(limnus) == expected, index
+
+    assert _layers(limnus)[:2] == ["L3", "L3"]
+
+
+def test_every_l2_becomes_l3_once_there_are_more_than_five(tmp_path: Path) -> None:
+    limnus = _limnus(tmp_path)
+    for index in range(6):
+        asyncio.run(limnus.process(_context(f"seed {index}")))
+    assert _layers(limnus) == ["L2"] * 5 + ["L1"]
+
+    asyncio.run(limnus.process(_context("sixth promotion")))
+    assert _layers(limnus) == ["L3"] * 6 + ["L1"]
+
+
+def test_unknown_layers_are_left_untouched(tmp_path: Path) -> None:
+    limnus = _limnus(tmp_path)
+    seeded = [{"id": "odd", "layer": "L9"}, {"id": "bare"}, {"id": "one", "layer": "L1"}]
+    limnus.mem_path.write_text(json.dumps(seeded), encoding="utf-8")
+
+    for index in range(8):
+        asyncio.run(limnus.process(_context(f"seed {index}")))
+
+    memories = json.loads(limnus.mem_path.read_text(encoding="utf-8"))
+    assert memories[0] == {"id": "odd", "layer": "L9"}
+    assert memories[1] == {"id": "bare"}
+    assert memories[2]["layer"] == "L3"
+
+
+def test_external_edit_rebuilds_layers_from_disk(tmp_path: Path) -> None:
+    limnus = _limnus(tmp_path)
+    for index in range(3):
+        asyncio.run(limnus.process(_context(f"seed {index}")))
+    assert _layers(limnus) == ["L2", "L2", "L1"]
+
+    # Another writer resets every memory to L1 behind the agent's back.
+    memories = json.loads(limnus.mem_path.read_text(encoding="utf-8"))
+    for memory in memories:
+        memory["layer"] = "L1"
+    limnus.mem_path.write_text(json.dumps(memories, indent=2), encoding="utf-8")
+
+    asyncio.run(limnus.process(_context("after edit")))
+    assert _layers(limnus) == ["L2", "L2", "L2", "L1"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from pipeline.logger import PipelineLogger
+from workspace.manager import WorkspaceManager
+
+
+def _context(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        timestamp="2025-01-01T00:00:00+00:00",
+        user_id="tester",
+        workspace_id="logs",
+        input_text=text,
+        intent=SimpleNamespace(intent_type="note"),
+    )
+
+
+def _logger(tmp_path: Path) -> PipelineLogger:
+    return PipelineLogger("logs", WorkspaceManager(root=tmp_path))
+
+
+def _assert_canonical(path: Path) -> list:
+    raw = path.read_text(encoding="utf-8")
+    entries = json.loads(raw)
+    assert raw == json.dumps(entries, indent=2)
+    return entries
+
+
+def test_first_append_replaces_empty_array(tmp_path: Path) -> None:
+    logger = _logger(tmp_path)
+    assert logger._log_path.read_text(encoding="utf-8") == "[]"
+
+    asyncio.run(logger.log_start(_context("seed")))
+
+    entries = _assert_canonical(logger._log_path)
+    assert [entry["event"] for entry in entries] == ["pipeline_start"]
+
+
+def test_many_appends_match_full_rewrite(tmp_path: Path) -> None:
+    logger = _logger(tmp_path)
+    context = _context("ünïcode ✨")
+
+    async def run() -> None:
+        for index in range(50):
+            await logger.log_agent_step(f"agent-{index}", context, {"n": index, "nested": {"ok": True}})
+
+    asyncio.run(run())
+
+    entries = _assert_canonical(logger._log_path)
+    assert [entry["result"]["n"] for entry in entries] == list(range(50))
+
+
+def test_missing_closing_bracket_falls_back_to_rewrite(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    logger = _logger(tmp_path)
+    rewrites: list = []
+    original = PipelineLogger._rewrite
+
+    def spy(self: PipelineLogger, entry: dict) -> None:
+        rewrites.append(entry["event"])
+        original(self, entry)
+
+    monkeypatch.setattr(PipelineLogger, "_rewrite", spy)
+    # A log cut off mid-write has no closing bracket to splice in front of.
+    logger._log_path.write_text('[\n  {\n    "event": "pipeline_start"', encoding="utf-8")
+
+    asyncio.run(logger.log_complete(_context("second"), {"success": True}))
+
+    entries = _assert_canonical(logger._log_path)
+    assert [entry["event"] for entry in entries] == ["pipeline_complete"]
+    assert rewrites == ["pipeline_complete"]
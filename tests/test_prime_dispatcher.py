@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from library_core._files import stat_stamp
+from library_core.orchestration.dispatcher import (
+    PrimeDispatcher,
+    _load_echo_mode,
+    _load_limnus_tail,
+    _read_last_record,
+)
+
+
+def _write(path: Path, records: list) -> int:
+    path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+    return path.stat().st_size
+
+
+def test_read_last_record_returns_final_object(tmp_path: Path) -> None:
+    path = tmp_path / "memory.json"
+    records = [
+        {"id": "a", "text": "plain"},
+        {"id": "b", "text": "braces } { inside", "meta": {"nested": {"depth": 2}}},
+    ]
+    size = _write(path, records)
+    assert _read_last_record(str(path), size) == records[-1]
+
+
+def test_read_last_record_grows_window_for_large_records(tmp_path: Path) -> None:
+    path = tmp_path / "memory.json"
+    records = [{"id": "a"}, {"id": "big", "text": "{" * 20000 + "x" * 20000}]
+    size = _write(path, records)
+    assert _read_last_record(str(path), size) == records[-1]
+
+
+def test_read_last_record_empty_array(tmp_path: Path) -> None:
+    path = tmp_path / "memory.json"
+    size = _write(path, [])
+    assert _read_last_record(str(path), size) is None
+
+
+def test_load_limnus_tail_follows_file_stamp(tmp_path: Path) -> None:
+    path = tmp_path / "memory.json"
+    _write(path, [{"id": "a", "layer": "L1"}])
+    assert _load_limnus_tail(str(path), stat_stamp(path)) == ("a", "L1")
+
+    _write(path, [{"id": "a", "layer": "L2"}, {"id": "b"}])
+    assert _load_limnus_tail(str(path), stat_stamp(path)) == ("b", "L2")
+
+    _write(path, [])
+    assert _load_limnus_tail(str(path), stat_stamp(path)) == (None, "L2")
+
+
+def test_load_echo_mode_rereads_same_size_rewrites(tmp_path: Path) -> None:
+    path = tmp_path / "echo_state.json"
+    assert _load_echo_mode(str(path)) is None
+
+    path.write_text(json.dumps({"last_mode": "fox"}), encoding="utf-8")
+    stat = path.stat()
+    assert _load_echo_mode(str(path)) == "fox"
+
+    path.write_text(json.dumps({"last_mode": "owl"}), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _load_echo_mode(str(path)) == "owl"
+
+    path.write_text("{}", encoding="utf-8")
+    assert _load_echo_mode(str(path)) == "balanced"
+
+
+def test_process_limnus_reports_newest_memory(tmp_path: Path) -> None:
+    dispatcher = PrimeDispatcher.__new__(PrimeDispatcher)
+    dispatcher._limnus_mem_path = str(tmp_path / "limnus_memory.json")
+    dispatcher.limnus = SimpleNamespace(cache=lambda text, tags: None)
+    context = SimpleNamespace(input_text="seed", user_id="tester")
+
+    assert dispatcher._process_limnus(context) == {"cached": True, "memory_id": None, "layer": "L2"}
+
+    _write(tmp_path / "limnus_memory.json", [{"id": "a", "layer": "L1"}, {"id": "b", "layer": "L3"}])
+    assert dispatcher._process_limnus(context) == {"cached": True, "memory_id": "b", "layer": "L3"}
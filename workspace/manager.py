@@ -8,9 +8,12 @@ capabilities and tie in collaboration sessions plus shared resources.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, ValuesView
+
+_SUBFOLDERS = ("logs", "state", "outputs", "collab")
 
 
 @dataclass(slots=True)
@@ -49,7 +52,9 @@ class WorkspaceManager:
 
     def __init__(self, root: Path | None = None) -> None:
         self._root = Path(root or ".").resolve()
+        self._workspaces_base = os.path.join(str(self._root), "workspaces")
         self._workspaces: Dict[str, WorkspaceRecord] = {}
+        self._ensured: set[str] = set()
 
     def register(self, workspace_id: str, name: str | None = None) -> WorkspaceRecord:
         record = WorkspaceRecord(
@@ -66,13 +71,18 @@ class WorkspaceManager:
             return self._workspaces[workspace_id]
         return self.register(workspace_id)
 
-    def list_workspaces(self) -> Iterable[WorkspaceRecord]:
-        return tuple(self._workspaces.values())
+    def list_workspaces(self) -> ValuesView[WorkspaceRecord]:
+        """Live read-only view of registered workspaces; copy it before registering more."""
+        return self._workspaces.values()
 
     def _workspace_root(self, workspace_id: str) -> Path:
-        return self._root / "workspaces" / workspace_id
+        # One string join and a single Path, instead of two chained ``/`` steps.
+        return Path(os.path.join(self._workspaces_base, workspace_id))
 
     def _ensure_structure(self, record: WorkspaceRecord) -> None:
+        if record.workspace_id in self._ensured:
+            return
         record.path.mkdir(parents=True, exist_ok=True)
-        for folder in ("logs", "state", "outputs", "collab"):
+        for folder in _SUBFOLDERS:
             (record.path / folder).mkdir(parents=True, exist_ok=True)
+        self._ensured.add(record.workspace_id)